@@ -0,0 +1,35 @@
+"""
+Shared guardspine-backend configuration for the GuardSpine test suites.
+
+Backend tests are marked with ``@pytest.mark.backend``. The conftest probes
+the backend once per session and skips every marked test if it is down.
+Under pytest-xdist the controller probes and passes the result to workers.
+"""
+
+import functools
+import os
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Backend API (optional - tests skip gracefully if not available)
+BACKEND_URL = os.getenv("GUARDSPINE_BACKEND_URL", "http://localhost:8000")
+BACKEND_API_KEY = os.getenv("GUARDSPINE_API_KEY", "")
+
+_LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+@functools.lru_cache(maxsize=1)
+def check_backend_available() -> bool:
+    """Check if guardspine-backend is reachable."""
+    if httpx is None:
+        return False
+    timeout = 0.5 if urlsplit(BACKEND_URL).hostname in _LOOPBACK_HOSTS else 5
+    try:
+        response = httpx.get(f"{BACKEND_URL}/health", timeout=timeout)
+        return response.status_code == 200
+    except Exception:
+        return False
@@ -0,0 +1,192 @@
+"""
+Shared JSON Schema helpers for the GuardSpine test suites.
+
+The evidence bundle schema and the golden vectors are parsed once per
+test session and reused by every test module that validates bundles.
+Golden vector files are read at import, so parametrized tests only list
+vectors that exist on disk.
+
+When fastjsonschema is installed, bundles are first checked with a
+code-generated validator. Only bundles it rejects are re-run through
+jsonschema's Draft202012Validator, which reports every error. fastjsonschema
+implements draft-07 at most, so the fast path is only enabled while every
+keyword in the schema means the same in draft-07 and 2020-12; otherwise
+jsonschema validates every bundle. Set GUARDSPINE_VALIDATOR=jsonschema to
+skip the fast path.
+
+JSON is parsed and serialized with orjson when it is installed. Anything
+that must be RFC 8785 canonical still goes through guardspine_kernel.
+"""
+
+import functools
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+import pytest
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:
+    Draft202012Validator = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SPEC_ROOT = Path(__file__).parent.parent
+FIXTURES_DIR = SPEC_ROOT / "fixtures" / "golden-vectors"
+SCHEMA_PATH = SPEC_ROOT / "schemas" / "evidence-bundle.schema.json"
+USE_FAST_VALIDATOR = fastjsonschema is not None and os.getenv("GUARDSPINE_VALIDATOR") != "jsonschema"
+
+# Keywords fastjsonschema's draft-07 generator handles exactly as draft 2020-12
+# does, plus annotations both validators ignore. Any other keyword (prefixItems,
+# unevaluatedProperties, dependentRequired, ...) disables the fast path.
+_FAST_ANNOTATIONS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "default", "examples",
+     "deprecated", "readOnly", "writeOnly", "format", "contentEncoding", "contentMediaType"}
+)
+_FAST_SCHEMA_MAPS = frozenset({"$defs", "definitions", "properties", "patternProperties"})
+_FAST_SCHEMA_LISTS = frozenset({"allOf", "anyOf", "oneOf"})
+_FAST_SUBSCHEMAS = frozenset(
+    {"not", "if", "then", "else", "items", "contains", "additionalProperties", "propertyNames"}
+)
+_FAST_KEYWORDS = (
+    _FAST_ANNOTATIONS
+    | _FAST_SCHEMA_MAPS
+    | _FAST_SCHEMA_LISTS
+    | _FAST_SUBSCHEMAS
+    | {"$ref", "type", "enum", "const", "required", "multipleOf", "minimum", "maximum",
+       "exclusiveMinimum", "exclusiveMaximum", "minLength", "maxLength", "pattern",
+       "minItems", "maxItems", "uniqueItems", "minProperties", "maxProperties"}
+)
+
+# Raw bytes of every golden vector on disk, keyed by path relative to FIXTURES_DIR.
+GOLDEN: Dict[str, bytes] = {
+    path.relative_to(FIXTURES_DIR).as_posix(): path.read_bytes() for path in sorted(FIXTURES_DIR.rglob("*.json"))
+}
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize to compact, non-ASCII-escaped JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, e.g. for HTTP request bodies."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return dumps_json(obj).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def load_golden_vector(name: str) -> Dict[str, Any]:
+    """Load a golden vector bundle. Callers must not mutate the result."""
+    if name not in GOLDEN:
+        pytest.skip(f"Golden vector not found: {name}")
+    return loads_json(GOLDEN[name])
+
+
+@functools.lru_cache(maxsize=1)
+def load_schema() -> Dict[str, Any]:
+    """Load the evidence bundle schema."""
+    return read_json(SCHEMA_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def get_validator() -> Optional["Draft202012Validator"]:
+    """Return the compiled bundle schema validator, or None if jsonschema is missing."""
+    if Draft202012Validator is None:
+        return None
+    return Draft202012Validator(load_schema())
+
+
+def unsupported_fast_keywords(schema: Any) -> Set[str]:
+    """Return the keywords in schema that fastjsonschema would not check like 2020-12."""
+    if not isinstance(schema, dict):
+        return set()
+    unsupported = set(schema.keys() - _FAST_KEYWORDS)
+    # Draft-07 ignores the siblings of $ref; 2020-12 applies them.
+    if "$ref" in schema and schema.keys() - _FAST_ANNOTATIONS - {"$ref", "$defs", "definitions"}:
+        unsupported.add("$ref with sibling keywords")
+    # Array-form items is tuple validation in draft-07 and prefixItems in 2020-12.
+    if isinstance(schema.get("items"), list):
+        unsupported.add("items (array form)")
+    for keyword, value in schema.items():
+        if keyword in _FAST_SCHEMA_MAPS and isinstance(value, dict):
+            subschemas = list(value.values())
+        elif keyword in _FAST_SCHEMA_LISTS and isinstance(value, list):
+            subschemas = value
+        elif keyword in _FAST_SUBSCHEMAS:
+            subschemas = [value]
+        else:
+            continue
+        for subschema in subschemas:
+            unsupported |= unsupported_fast_keywords(subschema)
+    return unsupported
+
+
+@functools.lru_cache(maxsize=1)
+def get_fast_validator() -> Optional[Callable[[Any], Any]]:
+    """Return the fastjsonschema validator, or None if the fast path is disabled."""
+    if not USE_FAST_VALIDATOR:
+        return None
+    unsupported = unsupported_fast_keywords(load_schema())
+    if unsupported:
+        warnings.warn(
+            f"{SCHEMA_PATH.name} uses {', '.join(sorted(unsupported))}, which fastjsonschema "
+            "does not validate like draft 2020-12; falling back to jsonschema",
+            stacklevel=2,
+        )
+        return None
+    # Formats are annotations in draft 2020-12; match jsonschema's default.
+    return fastjsonschema.compile(load_schema(), use_formats=False)
+
+
+def has_schema_error(bundle: Dict[str, Any]) -> Optional[bool]:
+    """Stop at the first schema violation. Returns None if jsonschema is missing."""
+    validator = get_validator()
+    if validator is None:
+        return None
+
+    fast_validate = get_fast_validator()
+    if fast_validate is not None:
+        try:
+            fast_validate(bundle)
+            return False
+        except fastjsonschema.JsonSchemaException:
+            pass
+    return next(validator.iter_errors(bundle), None) is not None
+
+
+def schema_errors(bundle: Dict[str, Any]) -> Optional[List[str]]:
+    """Validate bundle against JSON schema. Returns None if jsonschema is missing."""
+    failed = has_schema_error(bundle)
+    if not failed:
+        return None if failed is None else []
+    # Diagnostics are only built for bundles that actually fail.
+    return [f"{e.json_path}: {e.message}" for e in get_validator().iter_errors(bundle)]
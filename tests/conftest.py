@@ -0,0 +1,28 @@
+"""Shared pytest hooks for the GuardSpine test suites."""
+
+import pytest
+
+from _backend_util import check_backend_available
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Probe the backend in the xdist controller and hand the result to each worker."""
+    node.workerinput["backend_available"] = check_backend_available()
+
+
+def _backend_available(config) -> bool:
+    """Return the controller's probe result on xdist workers, else probe locally."""
+    workerinput = getattr(config, "workerinput", {})
+    if "backend_available" in workerinput:
+        return workerinput["backend_available"]
+    return check_backend_available()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Probe the backend once and skip every backend test if it is down."""
+    backend_items = [item for item in items if item.get_closest_marker("backend")]
+    if backend_items and not _backend_available(config):
+        skip_backend = pytest.mark.skip(reason="Backend not available")
+        for item in backend_items:
+            item.add_marker(skip_backend)
@@ -14,26 +14,49 @@ Usage:
     pytest test_e2e.py -v -k "test_full_pipeline"
 """
 
-import json
-import os
-import subprocess
+import copy
+import functools
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 import pytest
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+try:
+    from guardspine_kernel import seal_bundle, verify_bundle
+except ImportError:
+    seal_bundle = verify_bundle = None
+
+from _backend_util import BACKEND_API_KEY, BACKEND_URL
+from _schema_util import GOLDEN, dumps_json_bytes, load_golden_vector, schema_errors
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
-SPEC_ROOT = Path(__file__).parent.parent
-FIXTURES_DIR = SPEC_ROOT / "fixtures" / "golden-vectors"
-SCHEMA_PATH = SPEC_ROOT / "schemas" / "evidence-bundle.schema.json"
-
-# Backend API (optional - tests skip gracefully if not available)
-BACKEND_URL = os.getenv("GUARDSPINE_BACKEND_URL", "http://localhost:8000")
-BACKEND_API_KEY = os.getenv("GUARDSPINE_API_KEY", "")
+JSON_HEADERS = {"Content-Type": "application/json"}
+REGRESSION_VECTORS = [
+    name
+    for name in (
+        "v0.2.0-minimal-bundle.json",
+        "v0.2.0-multi-item-bundle.json",
+        "v0.2.0-signed-bundle.json",
+        "v0.2.1-sanitized-bundle.json",
+    )
+    if name in GOLDEN
+]
 
 
 # ============================================================================
@@ -46,29 +69,14 @@ def generate_uuid() -> str:
     return str(uuid4())
 
 
-def iso_timestamp() -> str:
-    """Get current ISO 8601 timestamp."""
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
-def check_python_package(package: str) -> bool:
-    """Check if a Python package is installed."""
-    try:
-        __import__(package)
-        return True
-    except ImportError:
-        return False
-
+@functools.lru_cache(maxsize=1)
+def _iso_for(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def check_backend_available() -> bool:
-    """Check if guardspine-backend is reachable."""
-    try:
-        import httpx
 
-        response = httpx.get(f"{BACKEND_URL}/health", timeout=5)
-        return response.status_code == 200
-    except Exception:
-        return False
+def iso_timestamp() -> str:
+    """Get current ISO 8601 timestamp (second precision)."""
+    return _iso_for(int(time.time()))
 
 
 # ============================================================================
@@ -83,6 +91,7 @@ def create_diff_item(
     artifact_id: str = "test-artifact",
 ) -> Dict[str, Any]:
     """Create a diff evidence item."""
+    change_types = [c.get("type") for c in changes]
     return {
         "item_id": generate_uuid(),
         "content_type": "guardspine/diff",
@@ -94,8 +103,8 @@ def create_diff_item(
             "algorithm": "unified",
             "changes": changes,
             "stats": {
-                "additions": sum(1 for c in changes if c.get("type") == "add"),
-                "deletions": sum(1 for c in changes if c.get("type") == "remove"),
+                "additions": change_types.count("add"),
+                "deletions": change_types.count("remove"),
             },
         },
     }
@@ -152,8 +161,6 @@ def create_approval_item(
 
 def seal_bundle_python(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Seal items into a bundle using guardspine-kernel-py."""
-    from guardspine_kernel import seal_bundle
-
     sealed = seal_bundle(items)
     # Wrap into a complete bundle
     return {
@@ -167,64 +174,89 @@ def seal_bundle_python(items: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def verify_bundle_python(bundle: Dict[str, Any]) -> Dict[str, Any]:
     """Verify a bundle using guardspine-kernel-py."""
-    from guardspine_kernel import verify_bundle
-
     return verify_bundle(bundle)
 
 
 def validate_bundle_schema(bundle: Dict[str, Any]) -> List[str]:
     """Validate bundle against JSON schema."""
-    try:
-        import jsonschema
-        from jsonschema import Draft202012Validator
+    errors = schema_errors(bundle)
+    return [] if errors is None else errors
 
-        schema = json.loads(SCHEMA_PATH.read_text())
-        validator = Draft202012Validator(schema)
-        return [f"{e.json_path}: {e.message}" for e in validator.iter_errors(bundle)]
-    except ImportError:
-        return []
 
-
-async def import_bundle_to_backend(bundle: Dict[str, Any]) -> Dict[str, Any]:
+async def import_bundle_to_backend(bundle: Dict[str, Any], client: "httpx.AsyncClient") -> Dict[str, Any]:
     """Import bundle to guardspine-backend."""
-    import httpx
-
     headers = {"Authorization": f"Bearer {BACKEND_API_KEY}"} if BACKEND_API_KEY else {}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BACKEND_URL}/api/v1/bundles/import",
-            json=bundle,
-            headers=headers,
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await client.post(
+        "/api/v1/bundles/import",
+        content=dumps_json_bytes(bundle),
+        headers={**headers, **JSON_HEADERS},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
-async def export_bundle_from_backend(bundle_id: str) -> Dict[str, Any]:
+async def export_bundle_from_backend(bundle_id: str, client: "httpx.AsyncClient") -> Dict[str, Any]:
     """Export bundle from guardspine-backend."""
-    import httpx
-
     headers = {"Authorization": f"Bearer {BACKEND_API_KEY}"} if BACKEND_API_KEY else {}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BACKEND_URL}/api/v1/bundles/import/{bundle_id}/export/spec",
-            headers=headers,
+    response = await client.get(
+        f"/api/v1/bundles/import/{bundle_id}/export/spec",
+        headers=headers,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+if pytest_asyncio is not None:
+
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def http_client():
+        """Backend client shared by every test in this module."""
+        async with httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
             timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+        ) as client:
+            yield client
 
 
 # ============================================================================
 # E2E Pipeline Tests
 # ============================================================================
 
+# Fixed items for determinism
+FIXED_ITEMS = [
+    {
+        "item_id": "fixed-id-001",
+        "content_type": "guardspine/test",
+        "content": {"value": 42},
+    }
+]
+
+
+@pytest.fixture(scope="class")
+def standard_bundle() -> Dict[str, Any]:
+    """Diff -> policy -> approval bundle sealed once per class. Deep-copy before mutating."""
+    items = [
+        create_diff_item("v1", "v2", [{"type": "add", "content": "original"}]),
+        create_policy_evaluation_item("policy-1", "pass"),
+        create_approval_item("user-1", "approved", "ok"),
+    ]
+    return seal_bundle_python(items)
+
+
+@pytest.fixture(scope="session")
+def fixed_root_bundle() -> Dict[str, Any]:
+    """Bundle sealed once from FIXED_ITEMS."""
+    return seal_bundle_python(FIXED_ITEMS)
+
 
 @pytest.mark.skipif(
-    not check_python_package("guardspine_kernel"),
+    seal_bundle is None,
     reason="guardspine-kernel-py not installed",
 )
 class TestE2EPipeline:
@@ -263,12 +295,14 @@ class TestE2EPipeline:
         # 2. Seal items into bundle
         bundle = seal_bundle_python(items)
 
-        # 3. Validate schema
-        schema_errors = validate_bundle_schema(bundle)
-        assert not schema_errors, f"Schema validation failed: {schema_errors}"
+        # 3-4. Validate schema and verify bundle concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            schema_future = executor.submit(validate_bundle_schema, bundle)
+            verify_future = executor.submit(verify_bundle_python, bundle)
+            schema_errors = schema_future.result()
+            result = verify_future.result()
 
-        # 4. Verify bundle
-        result = verify_bundle_python(bundle)
+        assert not schema_errors, f"Schema validation failed: {schema_errors}"
         assert result.get("valid") is True, f"Verification failed: {result}"
 
         # 5. Check structure
@@ -276,28 +310,14 @@ class TestE2EPipeline:
         assert len(bundle.get("items", [])) == 3
         assert len(bundle.get("immutability_proof", {}).get("hash_chain", [])) == 3
 
-    def test_bundle_items_have_correct_sequence(self):
+    def test_bundle_items_have_correct_sequence(self, standard_bundle):
         """Items in sealed bundle have correct sequence numbers."""
-        items = [
-            create_diff_item("v1", "v2", []),
-            create_policy_evaluation_item("policy-1", "pass"),
-            create_approval_item("user-1", "approved", "ok"),
-        ]
-
-        bundle = seal_bundle_python(items)
-
-        for idx, item in enumerate(bundle.get("items", [])):
+        for idx, item in enumerate(standard_bundle.get("items", [])):
             assert item.get("sequence") == idx, f"Item {idx} has wrong sequence"
 
-    def test_bundle_chain_linkage_correct(self):
+    def test_bundle_chain_linkage_correct(self, standard_bundle):
         """Hash chain entries link correctly."""
-        items = [
-            create_diff_item("v1", "v2", []),
-            create_policy_evaluation_item("policy-1", "pass"),
-        ]
-
-        bundle = seal_bundle_python(items)
-        chain = bundle.get("immutability_proof", {}).get("hash_chain", [])
+        chain = standard_bundle.get("immutability_proof", {}).get("hash_chain", [])
 
         # First entry uses genesis
         assert chain[0].get("previous_hash") == "genesis"
@@ -305,30 +325,18 @@ class TestE2EPipeline:
         # Second entry links to first
         assert chain[1].get("previous_hash") == chain[0].get("chain_hash")
 
-    def test_bundle_root_hash_deterministic(self):
+    def test_bundle_root_hash_deterministic(self, fixed_root_bundle):
         """Same items produce same root_hash."""
-        # Fixed items for determinism
-        items = [
-            {
-                "item_id": "fixed-id-001",
-                "content_type": "guardspine/test",
-                "content": {"value": 42},
-            }
-        ]
-
-        bundle1 = seal_bundle_python(items)
-        bundle2 = seal_bundle_python(items)
+        bundle2 = seal_bundle_python(FIXED_ITEMS)
 
-        root1 = bundle1.get("immutability_proof", {}).get("root_hash")
+        root1 = fixed_root_bundle.get("immutability_proof", {}).get("root_hash")
         root2 = bundle2.get("immutability_proof", {}).get("root_hash")
 
         assert root1 == root2, f"Root hash mismatch: {root1} != {root2}"
 
-    def test_tampered_bundle_fails_verification(self):
+    def test_tampered_bundle_fails_verification(self, standard_bundle):
         """Bundle with tampered content fails verification."""
-        items = [create_diff_item("v1", "v2", [{"type": "add", "content": "original"}])]
-
-        bundle = seal_bundle_python(items)
+        bundle = copy.deepcopy(standard_bundle)
 
         # Tamper with content
         bundle["items"][0]["content"]["changes"][0]["content"] = "tampered"
@@ -338,15 +346,16 @@ class TestE2EPipeline:
 
 
 @pytest.mark.skipif(
-    not check_python_package("guardspine_kernel"),
+    seal_bundle is None,
     reason="guardspine-kernel-py not installed",
 )
-@pytest.mark.skipif(not check_backend_available(), reason="Backend not available")
-@pytest.mark.asyncio
+@pytest.mark.backend
+@pytest.mark.xdist_group("backend")
+@pytest.mark.asyncio(loop_scope="module")
 class TestE2EPipelineWithBackend:
     """E2E tests that include backend integration."""
 
-    async def test_full_pipeline_with_backend(self):
+    async def test_full_pipeline_with_backend(self, http_client):
         """Complete pipeline: create -> seal -> verify -> import -> export -> verify."""
         # 1. Create evidence items
         items = [
@@ -371,13 +380,13 @@ class TestE2EPipelineWithBackend:
         assert local_result.get("valid") is True
 
         # 4. Import to backend
-        import_result = await import_bundle_to_backend(bundle)
+        import_result = await import_bundle_to_backend(bundle, http_client)
         assert import_result.get("success") is True
         bundle_id = import_result.get("bundle_id")
         assert bundle_id is not None
 
         # 5. Export from backend
-        exported_bundle = await export_bundle_from_backend(bundle_id)
+        exported_bundle = await export_bundle_from_backend(bundle_id, http_client)
 
         # 6. Verify exported bundle
         export_result = verify_bundle_python(exported_bundle)
@@ -393,44 +402,42 @@ class TestE2EPipelineWithBackend:
 # ============================================================================
 
 
-@pytest.mark.skipif(not check_backend_available(), reason="Backend not available")
-@pytest.mark.asyncio
+@pytest.mark.backend
+@pytest.mark.xdist_group("backend")
+@pytest.mark.asyncio(loop_scope="module")
 class TestSecurityE2E:
     """Security-focused E2E tests."""
 
-    async def test_l4_approval_requires_auth(self):
+    async def test_l4_approval_requires_auth(self, http_client):
         """L4 approval endpoint requires authentication."""
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            # Try to create approval without auth
-            response = await client.post(
-                f"{BACKEND_URL}/api/v1/approvals/create",
-                json={"action_id": "test", "decision": "approve"},
-                timeout=10,
-            )
-            assert response.status_code in [401, 403], f"Expected 401/403, got {response.status_code}"
-
-    async def test_unknown_tool_defaults_to_l3(self):
-        """Unknown tools should default to L3 review."""
-        import httpx
+        # Try to create approval without auth
+        response = await http_client.post(
+            "/api/v1/approvals/create",
+            content=dumps_json_bytes({"action_id": "test", "decision": "approve"}),
+            headers=JSON_HEADERS,
+            timeout=10,
+        )
+        assert response.status_code in [401, 403], f"Expected 401/403, got {response.status_code}"
 
+    async def test_unknown_tool_defaults_to_l3(self, http_client):
+        """Unknown tools should default to L3 review."""
         headers = {"Authorization": f"Bearer {BACKEND_API_KEY}"} if BACKEND_API_KEY else {}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{BACKEND_URL}/api/v1/evaluate",
-                json={
+        response = await http_client.post(
+            "/api/v1/evaluate",
+            content=dumps_json_bytes(
+                {
                     "tool_name": "completely_unknown_tool_xyz",
                     "action": "execute",
-                },
-                headers=headers,
-                timeout=10,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Should require at least L3 review
-                assert data.get("risk_tier", "L0") >= "L3" or data.get("requires_review") is True
+                }
+            ),
+            headers={**headers, **JSON_HEADERS},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            # Should require at least L3 review
+            assert data.get("risk_tier", "L0") >= "L3" or data.get("requires_review") is True
 
 
 # ============================================================================
@@ -443,20 +450,11 @@ class TestRegression:
 
     @pytest.mark.parametrize(
         "vector_name",
-        [
-            "v0.2.0-minimal-bundle.json",
-            "v0.2.0-multi-item-bundle.json",
-            "v0.2.0-signed-bundle.json",
-            "v0.2.1-sanitized-bundle.json",
-        ],
+        REGRESSION_VECTORS,
     )
     def test_golden_vectors_remain_valid(self, vector_name):
         """Golden vectors must remain schema-valid."""
-        path = FIXTURES_DIR / vector_name
-        if not path.exists():
-            pytest.skip(f"Golden vector not found: {vector_name}")
-
-        bundle = json.loads(path.read_text())
+        bundle = load_golden_vector(vector_name)
         errors = validate_bundle_schema(bundle)
         assert not errors, f"Regression: {vector_name} now fails validation: {errors}"
 